@@ -5,12 +5,9 @@ Registry for GitHub event handlers.
 import dataclasses
 import logging
 import sys
-import threading
 import typing as t
 
 import deprecated
-import requests
-import urllib3
 from nr.functional import coalesce
 
 from . import __version__
@@ -22,6 +19,8 @@ user_agent = f"python/{sys.version.split()[0]} github-bot-api/{__version__}"
 
 if t.TYPE_CHECKING:
     import github
+    import requests
+    import urllib3
 
 
 @dataclasses.dataclass
@@ -35,7 +34,7 @@ class GithubClientSettings:
     timeout: t.Optional[int] = None
     per_page: t.Optional[int] = None
     verify: t.Optional[bool] = None
-    retry: t.Optional[urllib3.Retry] = None
+    retry: t.Optional["urllib3.Retry"] = None
 
     def update(self, other: "GithubClientSettings") -> "GithubClientSettings":
         result = GithubClientSettings()
@@ -101,20 +100,32 @@ class GithubApp:
 
     def __post_init__(self):
         self._jwt_supplier = JwtSupplier(self.app_id, self.private_key)
-        self._lock = threading.Lock()
         self._installation_tokens: t.Dict[int, InstallationTokenSupplier] = {}
+        self._session: t.Optional["requests.Session"] = None
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        super().__setattr__(name, value)
+        # The memoized user agents contain the #user_agent and #app_id, so start over if either of them is set.
+        if name in ("user_agent", "app_id"):
+            self._user_agents: t.Dict[t.Optional[int], str] = {}
+        # Strip the trailing slash of the #v3_api_url once, for both the PyGithub clients and our own requests.
+        elif name == "v3_api_url":
+            self._v3_api_url = value.rstrip("/")
 
     def _get_base_github_client_settings(self) -> GithubClientSettings:
-        return GithubClientSettings(self.v3_api_url, self.get_user_agent())
+        return GithubClientSettings(self._v3_api_url, self.get_user_agent())
 
     def get_user_agent(self, installation_id: t.Optional[int] = None) -> str:
         """
         Create a user agent string for the PyGithub client, including the installation if specified.
         """
 
-        user_agent = f"{self.user_agent} PyGithub/python (app_id={self.app_id}"
-        if installation_id:
-            user_agent += f", installation_id={installation_id})"
+        user_agent = self._user_agents.get(installation_id)
+        if user_agent is None:
+            user_agent = f"{self.user_agent} PyGithub/python (app_id={self.app_id}"
+            if installation_id:
+                user_agent += f", installation_id={installation_id})"
+            self._user_agents[installation_id] = user_agent
         return user_agent
 
     @property
@@ -128,10 +139,11 @@ class GithubApp:
     @property
     def jwt_supplier(self) -> JwtSupplier:
         """
-        Returns a new #JwtSupplier that is used for generating JWT tokens for your GitHub application.
+        Returns a new #JwtSupplier that is used for generating JWT tokens for your GitHub application. It shares
+        the parsed private key with the application.
         """
 
-        return JwtSupplier(self.app_id, self.private_key)
+        return JwtSupplier(self.app_id, self.private_key, key_source=self._jwt_supplier)
 
     @property
     @deprecated.deprecated(reason="use GithubApp.app_client() instead", version="0.4.0")
@@ -161,11 +173,25 @@ class GithubApp:
         settings = self._get_base_github_client_settings().update(settings)
         return settings.make_client(jwt=self.jwt.value)
 
+    def _get_session(self) -> "requests.Session":
+        # Reuse connections to the GitHub API across installation token refreshes.
+        if self._session is None:
+            import requests
+
+            session = requests.Session()
+            session.headers["User-Agent"] = user_agent
+            self._session = session
+        return self._session
+
     def __requestor(self, auth_header: str, installation_id: int) -> t.Dict[str, str]:
-        return requests.post(
-            self.v3_api_url.rstrip("/") + f"/app/installations/{installation_id}/access_tokens",
-            headers={"Authorization": auth_header, "User-Agent": user_agent},
-        ).json()
+        return (
+            self._get_session()
+            .post(
+                f"{self._v3_api_url}/app/installations/{installation_id}/access_tokens",
+                headers={"Authorization": auth_header},
+            )
+            .json()
+        )
 
     def get_installation_token_supplier(self, installation_id: int) -> InstallationTokenSupplier:
         """
@@ -173,8 +199,11 @@ class GithubApp:
         *installation_id*.
         """
 
-        with self._lock:
-            return self._installation_tokens.setdefault(
+        # NOTE: #dict.setdefault() is atomic, so concurrent callers always end up with the same supplier (which
+        #       carries its own lock to refresh the token).
+        supplier = self._installation_tokens.get(installation_id)
+        if supplier is None:
+            supplier = self._installation_tokens.setdefault(
                 installation_id,
                 InstallationTokenSupplier(
                     self._jwt_supplier,
@@ -182,6 +211,7 @@ class GithubApp:
                     self.__requestor,
                 ),
             )
+        return supplier
 
     def installation_token(self, installation_id: int) -> TokenInfo:
         """
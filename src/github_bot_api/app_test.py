@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from github_bot_api.app import GithubApp
 from github_bot_api.token import TokenInfo
@@ -14,3 +14,36 @@ def test_simple_app():
     with patch("github_bot_api.token.InstallationTokenSupplier._new_token", return_value=token):
         app = GithubApp("UA/0.0.0", 42, "private_key")
         app.installation_client(1)
+
+
+def test_get_user_agent():
+    app = GithubApp("UA/0.0.0", 42, "private_key")
+    assert app.get_user_agent(1) == "UA/0.0.0 PyGithub/python (app_id=42, installation_id=1)"
+
+    app.user_agent = "UA/1.0.0"
+    app.app_id = 43
+    assert app.get_user_agent(1) == "UA/1.0.0 PyGithub/python (app_id=43, installation_id=1)"
+
+
+def test_v3_api_url():
+    app = GithubApp("UA/0.0.0", 42, "private_key", "https://github.example.com/api/v3/")
+    app.v3_api_url = "https://github.example.org/api/v3/"
+    assert app._get_base_github_client_settings().base_url == "https://github.example.org/api/v3"
+
+    session = Mock()
+    session.post.return_value.json.return_value = {"token": "abc", "expires_at": "2099-01-01T00:00:00Z"}
+    with patch("github_bot_api.token.JwtSupplier._new_token", return_value=TokenInfo(1, "Bearer", "jwt")):
+        with patch.object(app, "_get_session", return_value=session):
+            app.installation_token(1)
+    assert session.post.call_args[0][0] == "https://github.example.org/api/v3/app/installations/1/access_tokens"
+
+
+def test_jwt_suppliers_share_private_key():
+    token = TokenInfo(1, "Bearer", "jwt")
+    with patch("github_bot_api.token.load_private_key") as load_private_key:
+        with patch("github_bot_api.token.create_jwt", return_value=token):
+            app = GithubApp("UA/0.0.0", 42, "not a key")
+            supplier = app.jwt_supplier
+            load_private_key.assert_not_called()
+            assert supplier() == app.jwt_supplier() == app.jwt == token
+    load_private_key.assert_called_once_with("not a key")
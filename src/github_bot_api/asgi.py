@@ -0,0 +1,85 @@
+"""
+ASGI binding for handling GitHub webhook events, based on Starlette.
+
+Note that you need to install the `starlette` module separately (e.g. with the `starlette` extra).
+
+# Example
+
+```python
+from github_bot_api import Event, Webhook
+from github_bot_api.asgi import create_asgi_app
+
+async def on_any_event(event: Event) -> bool:
+  print(event)
+  return True
+
+webhook = Webhook(secret=None)
+webhook.listen('*', on_any_event)
+
+asgi_app = create_asgi_app(webhook)
+
+import uvicorn; uvicorn.run(asgi_app)
+```
+"""
+
+import logging
+import typing as t
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from .event import accept_event_raw
+from .webhook import Webhook
+
+logger = logging.getLogger(__name__)
+
+
+def create_event_handler(webhook: Webhook) -> t.Callable[[Request], t.Awaitable[Response]]:
+    """
+    Creates a Starlette endpoint that interprets the received HTTP request as a GitHub application event and
+    dispatches it via #webhook.dispatch_async(). Verifying the signature, parsing the payload and calling
+    synchronous event handlers happens in Starlette's thread pool, so it does not block the event loop. Events
+    that no handler is registered for are accepted without reading the request body, verifying its signature
+    or parsing it.
+    """
+
+    async def event_handler(request: Request) -> Response:
+        headers = request.headers
+        event_name = headers.get("X-GitHub-Event")
+        if event_name and not webhook.has_handlers(event_name):
+            logger.info("Event %r (id: %r) goes unmatched.", event_name, headers.get("X-GitHub-Delivery"))
+            return Response(status_code=202)
+
+        # NOTE: Collecting the chunks into a bytearray ourselves avoids holding both the chunks and the joined
+        #       body in memory, as #Request.body() does. The bytearray is parsed without another copy.
+        body = bytearray()
+        async for chunk in request.stream():
+            body += chunk
+
+        event = await run_in_threadpool(
+            accept_event_raw,
+            event_name,
+            headers.get("X-GitHub-Delivery"),
+            headers.get("X-Hub-Signature"),
+            headers.get("X-Hub-Signature-256"),
+            headers.get("User-Agent"),
+            headers.get("Content-Type"),
+            body,
+            webhook.signature_verifier,
+        )
+        await webhook.dispatch_async(event, run_in_threadpool)
+        return Response(status_code=202)
+
+    return event_handler
+
+
+def create_asgi_app(webhook: Webhook, path: str = "/event-handler") -> Starlette:
+    """
+    Creates a new #Starlette application with a `POST` event handler under the given *path* (defaulting
+    to `/event-handler`). This is a useful shorthand to attach your #Webhook to an ASGI server.
+    """
+
+    return Starlette(routes=[Route(path, create_event_handler(webhook), methods=["POST"])])
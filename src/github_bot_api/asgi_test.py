@@ -0,0 +1,75 @@
+import threading
+import typing as t
+
+from starlette.testclient import TestClient
+
+from github_bot_api.asgi import create_asgi_app
+from github_bot_api.event import Event
+from github_bot_api.signature import compute_signature
+from github_bot_api.webhook import Webhook
+
+BODY = b'{"action": "opened"}'
+HEADERS = {
+    "X-GitHub-Event": "issues",
+    "X-GitHub-Delivery": "72d3162e-cc78-11e3-81ab-4c9367dc0958",
+    "X-Hub-Signature-256": compute_signature(BODY, b"secret"),
+    "User-Agent": "GitHub-Hookshot/044aadd",
+    "Content-Type": "application/json",
+}
+
+
+def test_event_handler():
+    events: t.List[Event] = []
+    webhook = Webhook(secret="secret")
+
+    @webhook.listen("issues")
+    async def on_issues(event: Event) -> bool:
+        events.append(event)
+        return True
+
+    @webhook.listen("*")
+    def on_any_event(event: Event) -> bool:
+        raise AssertionError("event should have been handled by on_issues()")
+
+    client = TestClient(create_asgi_app(webhook))
+    response = client.post("/event-handler", content=BODY, headers=HEADERS)
+
+    assert response.status_code == 202
+    assert [(e.name, e.payload) for e in events] == [("issues", {"action": "opened"})]
+
+
+def test_event_handler_runs_sync_handlers():
+    events: t.List[Event] = []
+    webhook = Webhook(secret="secret")
+
+    @webhook.listen("issue*")
+    def on_issues(event: Event) -> bool:
+        events.append(event)
+        return True
+
+    client = TestClient(create_asgi_app(webhook))
+    assert client.post("/event-handler", content=BODY, headers=HEADERS).status_code == 202
+    assert (
+        client.post("/event-handler", content=b"not json", headers={**HEADERS, "X-GitHub-Event": "push"}).status_code
+        == 202
+    )
+    assert [e.name for e in events] == ["issues"]
+
+
+def test_event_handler_runs_sync_handlers_in_worker_thread():
+    threads: t.Dict[str, int] = {}
+    webhook = Webhook(secret="secret")
+
+    @webhook.listen("issues")
+    async def on_issues_async(event: Event) -> bool:
+        threads["loop"] = threading.get_ident()
+        return False
+
+    @webhook.listen("issues")
+    def on_issues(event: Event) -> bool:
+        threads["handler"] = threading.get_ident()
+        return True
+
+    client = TestClient(create_asgi_app(webhook))
+    assert client.post("/event-handler", content=BODY, headers=HEADERS).status_code == 202
+    assert threads["handler"] != threads["loop"]
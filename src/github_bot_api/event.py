@@ -9,9 +9,14 @@ import logging
 import typing as t
 from dataclasses import dataclass
 
-from .signature import check_signature
+from .signature import SignatureVerifier, check_signature
 from .utils.mime import get_mime_components
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,6 +26,8 @@ class Event:
     Represents a GitHub webhook event.
     """
 
+    __slots__ = ("name", "delivery_id", "signature", "user_agent", "payload")
+
     #: The name of the event. Could be `pull_request`, for example.
     name: str
 
@@ -41,8 +48,8 @@ class Event:
 
 def accept_event(
     headers: t.Mapping[str, str],
-    raw_body: bytes,
-    webhook_secret: t.Optional[str] = None,
+    raw_body: t.Union[bytes, bytearray, t.Iterable[bytes]],
+    webhook_secret: t.Union[str, bytes, SignatureVerifier, None] = None,
 ) -> Event:
     """
     Converts thee HTTP *headers* and the *raw_body* to an #Event object.
@@ -50,46 +57,124 @@ def accept_event(
     # Arguments
     headers: The HTTP headers. Must have `X-Github-Event`, `X-Github-Delivery`, `User-Agent`, `Content-Type`.
       May have `X-Hub-Signature` or `X-Hub-Signature-256`.
-    raw_body: The raw request body for the event. This is converted into a JSON payload.
+    raw_body: The raw request body for the event. This is converted into a JSON payload. May also be an
+      iterable of chunks (e.g. read from the request stream), in which case the signature is computed
+      while the body is read.
     webhook_secret: If specified, the `X-Hub-Signature` or `X-Hub-Signature-256` headers are used to verify
-      the signature of the payload. If not specified, the client does not validate the signature.
+      the signature of the payload. If not specified, the client does not validate the signature. Pass
+      the secret as bytes (e.g. #Webhook.secret_bytes) to avoid encoding it for every event, or as a
+      #SignatureVerifier (e.g. #Webhook.signature_verifier) to also reuse the HMAC key setup.
     """
 
-    event_name = headers.get("X-GitHub-Event")
-    delivery_id = headers.get("X-GitHub-Delivery")
-    signature_1 = headers.get("X-Hub-Signature")
-    signature_256 = headers.get("X-Hub-Signature-256")
-    user_agent = headers.get("User-Agent")
-    content_type = headers.get("Content-Type")
+    return accept_event_raw(
+        headers.get("X-GitHub-Event"),
+        headers.get("X-GitHub-Delivery"),
+        headers.get("X-Hub-Signature"),
+        headers.get("X-Hub-Signature-256"),
+        headers.get("User-Agent"),
+        headers.get("Content-Type"),
+        raw_body,
+        webhook_secret,
+    )
+
+
+def accept_event_raw(
+    event_name: t.Optional[str],
+    delivery_id: t.Optional[str],
+    signature_1: t.Optional[str],
+    signature_256: t.Optional[str],
+    user_agent: t.Optional[str],
+    content_type: t.Optional[str],
+    raw_body: t.Union[bytes, bytearray, t.Iterable[bytes]],
+    webhook_secret: t.Union[str, bytes, SignatureVerifier, None] = None,
+) -> Event:
+    """
+    Like #accept_event(), but takes the values of the relevant HTTP headers as separate arguments. This is
+    useful for HTTP frameworks where the headers can be retrieved more cheaply than through a mapping with
+    case-insensitive lookups (e.g. from the WSGI environment).
+
+    # Arguments
+    event_name: The value of the `X-GitHub-Event` header.
+    delivery_id: The value of the `X-GitHub-Delivery` header.
+    signature_1: The value of the `X-Hub-Signature` header.
+    signature_256: The value of the `X-Hub-Signature-256` header.
+    user_agent: The value of the `User-Agent` header.
+    content_type: The value of the `Content-Type` header.
+    raw_body: See #accept_event().
+    webhook_secret: See #accept_event().
+    """
 
     if not event_name or not delivery_id or not user_agent or not content_type:
         raise InvalidRequest("missing required headers")
-    if webhook_secret is not None and not signature_1 and not signature_256:
-        raise InvalidRequest("webhook secret is configured but no signature header was received")
-
-    mime_type, parameters = get_mime_components(content_type)
-    if mime_type != "application/json":
-        raise InvalidRequest(f"expected Content-Type: application/json, got {content_type}")
-    encoding = dict(parameters).get("encoding", "UTF-8")
 
+    # Verify the signature before we do any other work on the request.
+    if isinstance(webhook_secret, str):
+        webhook_secret = webhook_secret.encode("ascii")
+    body: t.Union[bytes, bytearray]
     if webhook_secret is not None:
         if signature_256:
-            check_signature(signature_256, raw_body, webhook_secret.encode("ascii"), algo="sha256")
+            signature, algo = signature_256, "sha256"
         elif signature_1:
-            check_signature(signature_1, raw_body, webhook_secret.encode("ascii"), algo="sha1")
+            signature, algo = signature_1, "sha1"
+        else:
+            raise InvalidRequest("webhook secret is configured but no signature header was received")
+        signed_body: t.Union[bytes, bytearray, t.Iterable[bytes]]
+        if isinstance(raw_body, (bytes, bytearray)):
+            body = signed_body = raw_body
+        else:
+            body = bytearray()
+            signed_body = _collect_chunks(raw_body, body)
+        if isinstance(webhook_secret, SignatureVerifier):
+            webhook_secret.check_signature(signature, signed_body, algo)
         else:
-            raise RuntimeError
+            check_signature(signature, signed_body, webhook_secret, algo)
+    elif isinstance(raw_body, (bytes, bytearray)):
+        body = raw_body
+    else:
+        body = bytearray()
+        for chunk in raw_body:
+            body += chunk
+
+    # NOTE: GitHub always sends UTF-8 encoded payloads, which both #json.loads() and #orjson.loads() accept
+    #       as bytes, sparing us a decoded copy of the payload. The Content-Type header only needs to be parsed
+    #       if it is not exactly what GitHub sends.
+    if content_type != "application/json":
+        mime_type, parameters = get_mime_components(content_type)
+        if mime_type != "application/json":
+            raise InvalidRequest(f"expected Content-Type: application/json, got {content_type}")
+        encoding = next((value.strip() for key, value in parameters if key.strip() == "encoding"), "UTF-8")
+        if encoding.lower() not in ("utf-8", "utf8", "ascii"):
+            logger.warning("Event %r (id: %r) has encoding %r, parsing it as UTF-8.", event_name, delivery_id, encoding)
+
+    payload = _loads(body)
 
     return Event(
         event_name,
         delivery_id,
         signature_256 or signature_1,
         user_agent,
-        json.loads(raw_body.decode(encoding)),
+        payload,
     )
 
 
+def _collect_chunks(chunks: t.Iterable[bytes], into: bytearray) -> t.Iterator[bytes]:
+    for chunk in chunks:
+        into += chunk
+        yield chunk
+
+
+def _loads(data: t.Union[str, bytes, bytearray]) -> t.Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NOTE: #orjson is stricter than #json, e.g. it rejects NaN and unpaired surrogates. Falling back to
+            #       #json ensures that installing #orjson does not make us reject events that we accepted before.
+            pass
+    return json.loads(data)
+
+
 class InvalidRequest(Exception):
     """
-    Raised when an invalid request is passed to #accept_event().
+    Raised when an invalid request is passed to #accept_event() or #accept_event_raw().
     """
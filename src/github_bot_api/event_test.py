@@ -0,0 +1,64 @@
+import math
+
+import pytest
+
+from github_bot_api.event import InvalidRequest, accept_event
+from github_bot_api.signature import SignatureMismatchException, compute_signature
+
+HEADERS = {
+    "X-GitHub-Event": "push",
+    "X-GitHub-Delivery": "72d3162e-cc78-11e3-81ab-4c9367dc0958",
+    "User-Agent": "GitHub-Hookshot/044aadd",
+    "Content-Type": "application/json",
+}
+
+
+def test_accept_event():
+    event = accept_event(HEADERS, b'{"ref": "refs/heads/main"}')
+    assert event.name == "push"
+    assert event.delivery_id == "72d3162e-cc78-11e3-81ab-4c9367dc0958"
+    assert event.signature is None
+    assert event.payload == {"ref": "refs/heads/main"}
+
+
+def test_accept_event_with_encoding(caplog: pytest.LogCaptureFixture):
+    headers = {**HEADERS, "Content-Type": "application/json; encoding=utf-8"}
+    assert accept_event(headers, '{"author": "Jos\u00e9"}'.encode()).payload == {"author": "Jos\u00e9"}
+    assert not caplog.records
+
+    headers = {**HEADERS, "Content-Type": "application/json; encoding=latin-1"}
+    assert accept_event(headers, b'{"ref": "refs/heads/main"}').payload == {"ref": "refs/heads/main"}
+    assert "parsing it as UTF-8" in caplog.text
+
+
+def test_accept_event_checks_signature():
+    body = b'{"ref": "refs/heads/main"}'
+    headers = {**HEADERS, "X-Hub-Signature-256": compute_signature(body, b"secret")}
+    assert accept_event(headers, body, "secret").signature == headers["X-Hub-Signature-256"]
+    with pytest.raises(SignatureMismatchException):
+        accept_event(headers, body, "other-secret")
+    with pytest.raises(InvalidRequest):
+        accept_event(HEADERS, body, "secret")
+
+
+def test_accept_event_with_secret_bytes():
+    body = b'{"ref": "refs/heads/main"}'
+    headers = {**HEADERS, "X-Hub-Signature": compute_signature(body, b"secret", "sha1")}
+    assert accept_event(headers, body, b"secret").payload == {"ref": "refs/heads/main"}
+
+
+def test_accept_event_from_chunks():
+    body = b'{"ref": "refs/heads/main"}'
+    headers = {**HEADERS, "X-Hub-Signature-256": compute_signature(body, b"secret")}
+    assert accept_event(headers, [body[:5], body[5:]], b"secret").payload == {"ref": "refs/heads/main"}
+    assert accept_event(headers, [body[:5], body[5:]]).payload == {"ref": "refs/heads/main"}
+
+
+def test_accept_event_with_invalid_content_type():
+    with pytest.raises(InvalidRequest):
+        accept_event({**HEADERS, "Content-Type": "application/x-www-form-urlencoded"}, b"payload=%7B%7D")
+
+
+def test_accept_event_with_payload_rejected_by_orjson():
+    event = accept_event(HEADERS, b'{"value": NaN}')
+    assert math.isnan(event.payload["value"])
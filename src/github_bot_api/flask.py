@@ -22,23 +22,48 @@ flask_app.run()
 ```
 """
 
+import functools
+import logging
 import typing as t
 
 import flask
 
-from .event import accept_event
+from .event import accept_event_raw
 from .webhook import Webhook
 
+logger = logging.getLogger(__name__)
+
+#: The size of the chunks in which the request body is read.
+_CHUNK_SIZE = 65536
+
 
 def create_event_handler(webhook: Webhook) -> t.Callable[[], t.Tuple[t.Text, int, t.Dict[str, str]]]:
     """
     Creates an event handler flask view that interprets the received HTTP request as a GitHub application
-    event and dispatches it via #webhook.dispatch().
+    event and dispatches it via #webhook.dispatch(). Events that no handler is registered for are accepted
+    without reading the request body, verifying its signature or parsing it.
     """
 
     def event_handler():
-        event = accept_event(
-            t.cast(t.Mapping[str, str], flask.request.headers), flask.request.get_data(), webhook.secret
+        # NOTE: Reading the WSGI environment directly is cheaper than the case-insensitive lookups
+        #       of #flask.Request.headers.
+        environ = flask.request.environ
+        event_name = environ.get("HTTP_X_GITHUB_EVENT")
+        if event_name and not webhook.has_handlers(event_name):
+            logger.info("Event %r (id: %r) goes unmatched.", event_name, environ.get("HTTP_X_GITHUB_DELIVERY"))
+            return "", 202, {}
+
+        # Stream the body so the signature can be computed while it is being read.
+        chunks = iter(functools.partial(flask.request.stream.read, _CHUNK_SIZE), b"")
+        event = accept_event_raw(
+            event_name,
+            environ.get("HTTP_X_GITHUB_DELIVERY"),
+            environ.get("HTTP_X_HUB_SIGNATURE"),
+            environ.get("HTTP_X_HUB_SIGNATURE_256"),
+            environ.get("HTTP_USER_AGENT"),
+            environ.get("CONTENT_TYPE"),
+            chunks,
+            webhook.signature_verifier,
         )
         webhook.dispatch(event)
         return "", 202, {}
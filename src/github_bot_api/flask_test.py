@@ -0,0 +1,43 @@
+import typing as t
+
+from github_bot_api.event import Event
+from github_bot_api.flask import create_flask_app
+from github_bot_api.signature import compute_signature
+from github_bot_api.webhook import Webhook
+
+BODY = b'{"action": "opened"}'
+HEADERS = {
+    "X-GitHub-Event": "issues",
+    "X-GitHub-Delivery": "72d3162e-cc78-11e3-81ab-4c9367dc0958",
+    "X-Hub-Signature-256": compute_signature(BODY, b"secret"),
+    "User-Agent": "GitHub-Hookshot/044aadd",
+    "Content-Type": "application/json",
+}
+
+
+def test_event_handler():
+    events: t.List[Event] = []
+    webhook = Webhook(secret="secret")
+
+    @webhook.listen("issues")
+    def on_issues(event: Event) -> bool:
+        events.append(event)
+        return True
+
+    client = create_flask_app(__name__, webhook).test_client()
+    response = client.post("/event-handler", data=BODY, headers=HEADERS)
+
+    assert response.status_code == 202
+    assert [(e.name, e.signature, e.payload) for e in events] == [
+        ("issues", HEADERS["X-Hub-Signature-256"], {"action": "opened"})
+    ]
+
+
+def test_event_handler_skips_unmatched_events():
+    webhook = Webhook(secret="secret")
+    webhook.listen("push", lambda event: True)
+
+    client = create_flask_app(__name__, webhook).test_client()
+    response = client.post("/event-handler", data=b"not even json", headers=HEADERS)
+
+    assert response.status_code == 202
@@ -0,0 +1,56 @@
+import pytest
+
+from github_bot_api.signature import (
+    SignatureMismatchException,
+    SignatureVerifier,
+    check_signature,
+    compute_signature,
+)
+
+PAYLOAD = b'{"zen": "Keep it logically awesome."}'
+
+
+def test_compute_signature():
+    assert compute_signature(b"Hello, World!", b"It's a Secret to Everybody") == (
+        "sha256=757107ea0eb2509fc211221cce984b8a37570b6d7586c22c46f4379c8b043e17"
+    )
+    assert compute_signature(PAYLOAD, b"secret", "sha1").startswith("sha1=")
+    with pytest.raises(ValueError):
+        compute_signature(PAYLOAD, b"secret", "md5")
+
+
+@pytest.mark.parametrize("algo", ["sha1", "sha256"])
+def test_check_signature(algo: str):
+    check_signature(compute_signature(PAYLOAD, b"secret", algo), PAYLOAD, b"secret", algo)
+
+
+@pytest.mark.parametrize(
+    "sig",
+    [
+        compute_signature(PAYLOAD, b"other-secret"),
+        compute_signature(PAYLOAD, b"secret", "sha1"),
+        compute_signature(PAYLOAD, b"secret").replace("sha256=", "sha1="),
+        compute_signature(PAYLOAD, b"secret")[:-2],
+        "sha256=not-hex",
+        "",
+    ],
+)
+def test_check_signature_mismatch(sig: str):
+    with pytest.raises(SignatureMismatchException):
+        check_signature(sig, PAYLOAD, b"secret")
+
+
+def test_check_signature_from_chunks():
+    check_signature(compute_signature(PAYLOAD, b"secret"), [PAYLOAD[:7], PAYLOAD[7:]], b"secret")
+
+
+@pytest.mark.parametrize("algo", ["sha1", "sha256"])
+def test_signature_verifier(algo: str):
+    verifier = SignatureVerifier(b"secret")
+    assert verifier.compute_signature(PAYLOAD, algo) == compute_signature(PAYLOAD, b"secret", algo)
+    for _ in range(2):
+        verifier.check_signature(compute_signature(PAYLOAD, b"secret", algo), [PAYLOAD[:7], PAYLOAD[7:]], algo)
+        with pytest.raises(SignatureMismatchException):
+            verifier.check_signature(compute_signature(PAYLOAD, b"other-secret", algo), PAYLOAD, algo)
+    with pytest.raises(ValueError):
+        verifier.check_signature("md5=", PAYLOAD, "md5")
@@ -6,17 +6,19 @@ environment-to-create-a-github-app
 """
 
 import abc
+import calendar
 import datetime
 import logging
 import threading
 import time
 import typing as t
-from dataclasses import dataclass
-
-import jwt
+from dataclasses import dataclass, field
 
 from .utils.types import Supplier
 
+if t.TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +28,8 @@ class TokenInfo:
     Represents a token including it's expiration time, type and token string value.
     """
 
+    __slots__ = ("exp", "type", "value")
+
     #: The timestamp after which the token expires. This is in local client time.
     exp: int
 
@@ -42,7 +46,7 @@ class TokenInfo:
         return f"{self.type} {self.value}"
 
 
-def create_jwt(app_id: int, expires_in: int, private_key: str) -> TokenInfo:
+def create_jwt(app_id: int, expires_in: int, private_key: t.Union[str, "RSAPrivateKey"]) -> TokenInfo:
     """
     Generate a JWT for a GitHub App.
 
@@ -51,43 +55,70 @@ def create_jwt(app_id: int, expires_in: int, private_key: str) -> TokenInfo:
     expires_in: The time until the token expires in seconds. GitHub does not allow
       an expiration time higher than 10 minutes (the token may be accepted but isn't valid
       for as long as you might expected).
-    private_key: The RSA private key that was issued for the GitHub bot.
+    private_key: The RSA private key that was issued for the GitHub bot. Can be the PEM encoded key or
+      an already loaded key object (see #load_private_key()), which saves parsing the key again.
 
     # Returns
     The JWT as a #TokenInfo object.
     """
 
+    import jwt
+
     now = int(time.time())
     exp = now + expires_in
-    payload = {"iss": app_id, "iat": now, "exp": exp}
+    # NOTE: PyJWT 2.10+ requires the issuer to be a string.
+    payload = {"iss": str(app_id), "iat": now, "exp": exp}
     token = jwt.encode(payload, private_key, algorithm="RS256")
     return TokenInfo(exp, "Bearer", token)
 
 
+def load_private_key(private_key: str) -> "RSAPrivateKey":
+    """
+    Load a PEM encoded RSA private key. The returned object can be passed to #create_jwt().
+    """
+
+    from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+    from cryptography.hazmat.primitives.serialization import load_pem_private_key
+
+    key = load_pem_private_key(private_key.encode("ascii"), password=None)
+    if not isinstance(key, RSAPrivateKey):
+        raise ValueError(f"expected an RSA private key, got {type(key).__name__}")
+    return key
+
+
 class RefreshableTokenSupplier(Supplier[TokenInfo], metaclass=abc.ABCMeta):
     """
     Base class for token suppliers.
     """
 
     def __post_init__(self):
-        self._cached_token: t.Optional[TokenInfo] = None
+        # The cached token and the time on the monotonic clock after which it needs to be refreshed. Both are
+        # stored in a single attribute so that they can be read consistently without holding the lock.
+        self._cached: t.Optional[t.Tuple[TokenInfo, float]] = None
         self._lock: threading.Lock = threading.Lock()
 
     @abc.abstractmethod
-    def _is_expired(self, token: TokenInfo) -> bool:
-        pass
+    def _get_lifetime(self, token: TokenInfo) -> float:
+        "Return the number of seconds after which the *token* should be refreshed."
 
     @abc.abstractmethod
     def _new_token(self) -> TokenInfo:
         pass
 
     def __call__(self) -> TokenInfo:
+        # Only acquire the lock if the token needs to be refreshed, and check again once we have it in case
+        # another thread refreshed it in the meantime.
+        cached = self._cached
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
         with self._lock:
-            if self._cached_token is not None and not self._is_expired(self._cached_token):
-                return self._cached_token
-            self._cached_token = self._new_token()
-            assert isinstance(self._cached_token, TokenInfo), type(self)
-            return self._cached_token
+            cached = self._cached
+            if cached is not None and time.monotonic() < cached[1]:
+                return cached[0]
+            token = self._new_token()
+            assert isinstance(token, TokenInfo), type(self)
+            self._cached = (token, time.monotonic() + self._get_lifetime(token))
+            return token
 
 
 @dataclass
@@ -108,14 +139,30 @@ class JwtSupplier(RefreshableTokenSupplier):
     #: If the token is close to expire within this threshold (in seconds), it is renewed.
     threshold: int = 30
 
+    #: Another #JwtSupplier for the same #private_key to take the parsed key from instead of parsing it again.
+    key_source: t.Optional["JwtSupplier"] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        self._signing_key: t.Optional["RSAPrivateKey"] = None
+
     # RefreshableTokenSupplier Overrides
 
-    def _is_expired(self, token: TokenInfo) -> bool:
-        return (token.exp - time.time()) <= self.threshold
+    def _get_lifetime(self, token: TokenInfo) -> float:
+        return token.exp - time.time() - self.threshold
+
+    def _get_signing_key(self) -> "RSAPrivateKey":
+        # NOTE: The key is parsed only once, and not before a token is actually needed.
+        if self._signing_key is None:
+            if self.key_source is not None:
+                self._signing_key = self.key_source._get_signing_key()
+            else:
+                self._signing_key = load_private_key(self.private_key)
+        return self._signing_key
 
     def _new_token(self) -> TokenInfo:
         logger.info("Refreshing JWT for app_id %r.", self.app_id)
-        return create_jwt(self.app_id, self.expires_in, self.private_key)
+        return create_jwt(self.app_id, self.expires_in, self._get_signing_key())
 
 
 @dataclass
@@ -139,11 +186,35 @@ class InstallationTokenSupplier(RefreshableTokenSupplier):
 
     # RefreshableTokenSupplier Overrides
 
-    def _is_expired(self, token: TokenInfo) -> bool:
-        return (token.exp - time.time()) <= self.threshold
+    def _get_lifetime(self, token: TokenInfo) -> float:
+        return token.exp - time.time() - self.threshold
 
     def _new_token(self) -> TokenInfo:
         logger.info("Fetching token for installation %s", self.installation_id)
         data = self.requestor(self.app_jwt().auth_header, self.installation_id)
-        expires_at = datetime.datetime.strptime(data["expires_at"], "%Y-%m-%dT%H:%M:%S%z")
-        return TokenInfo(int(expires_at.timestamp()), "token", data["token"])
+        return TokenInfo(_parse_timestamp(data["expires_at"]), "token", data["token"])
+
+
+def _parse_timestamp(value: str) -> int:
+    """
+    Parses an ISO 8601 timestamp as returned by the GitHub API into a Unix timestamp.
+    """
+
+    # GitHub returns timestamps in UTC in the form `YYYY-MM-DDTHH:MM:SSZ`, which we can slice directly.
+    if len(value) == 20 and value[10] == "T" and value[19] == "Z":
+        try:
+            return calendar.timegm(
+                (
+                    int(value[0:4]),
+                    int(value[5:7]),
+                    int(value[8:10]),
+                    int(value[11:13]),
+                    int(value[14:16]),
+                    int(value[17:19]),
+                )
+            )
+        except ValueError:
+            pass
+
+    # NOTE: #datetime.datetime.fromisoformat() only accepts a trailing `Z` since Python 3.11.
+    return int(datetime.datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
@@ -0,0 +1,46 @@
+import time
+from unittest.mock import Mock
+
+import jwt
+
+from github_bot_api.token import InstallationTokenSupplier, JwtSupplier, TokenInfo, _parse_timestamp
+
+
+def make_supplier(requestor: Mock) -> InstallationTokenSupplier:
+    return InstallationTokenSupplier(Mock(return_value=TokenInfo(0, "Bearer", "jwt")), 42, requestor)
+
+
+def test_installation_token_supplier_caches_token():
+    requestor = Mock(return_value={"token": "abc", "expires_at": "2099-01-01T00:00:00Z"})
+    supplier = make_supplier(requestor)
+    assert supplier() == supplier() == TokenInfo(4070908800, "token", "abc")
+    requestor.assert_called_once_with("Bearer jwt", 42)
+
+
+def test_installation_token_supplier_refreshes_expired_token():
+    expires_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + 10))
+    requestor = Mock(return_value={"token": "abc", "expires_at": expires_at})
+    supplier = make_supplier(requestor)
+    supplier()
+    supplier()
+    assert requestor.call_count == 2
+
+
+def test_jwt_supplier():
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode("ascii")
+
+    token = JwtSupplier(42, pem)()
+    assert token.type == "Bearer"
+    assert jwt.decode(token.value, key.public_key(), algorithms=["RS256"])["iss"] == "42"
+
+
+def test_parse_timestamp():
+    assert _parse_timestamp("2016-07-11T22:14:10Z") == 1468275250
+    assert _parse_timestamp("2016-07-11T22:14:10+00:00") == 1468275250
+    assert _parse_timestamp("2016-07-12T00:14:10+02:00") == 1468275250
@@ -1,3 +1,4 @@
+import functools
 import typing as t
 
 
@@ -7,6 +8,19 @@ def get_mime_components(mime: str) -> t.Tuple[str, t.List[t.Tuple[str, str]]]:
     it's `key=value` parameters.
     """
 
+    # Fast path for the common case of a mimetype without parameters.
+    if ";" not in mime:
+        name = mime.strip()
+        if not name:
+            raise ValueError(f"bad mimetype: {mime!r}")
+        return name, []
+
+    name, parameters = _parse_mime(mime)
+    return name, list(parameters)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_mime(mime: str) -> t.Tuple[str, t.Tuple[t.Tuple[str, str], ...]]:
     # TODO(nrosenstein): Support escaped special characters in parameters
     #   (e.g. a ";" as part of a value).
 
@@ -19,6 +33,7 @@ def get_mime_components(mime: str) -> t.Tuple[str, t.List[t.Tuple[str, str]]]:
         if "=" not in part:
             parameters.append((part, ""))
         else:
-            parameters.append(part.partition("=")[::2])
+            key, _, value = part.partition("=")
+            parameters.append((key, value))
 
-    return parts[0].strip(), parameters
+    return parts[0].strip(), tuple(parameters)
@@ -0,0 +1,23 @@
+import pytest
+
+from github_bot_api.utils.mime import get_mime_components
+
+
+def test_get_mime_components():
+    assert get_mime_components("application/json") == ("application/json", [])
+    assert get_mime_components(" application/json ") == ("application/json", [])
+    assert get_mime_components("application/json;charset=utf-8;foo") == (
+        "application/json",
+        [("charset", "utf-8"), ("foo", "")],
+    )
+
+
+def test_get_mime_components_returns_a_new_list():
+    get_mime_components("application/json;charset=utf-8")[1].clear()
+    assert get_mime_components("application/json;charset=utf-8")[1] == [("charset", "utf-8")]
+
+
+@pytest.mark.parametrize("mime", ["", " ", "; charset=utf-8"])
+def test_get_mime_components_bad_mimetype(mime: str):
+    with pytest.raises(ValueError):
+        get_mime_components(mime)
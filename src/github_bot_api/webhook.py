@@ -1,18 +1,117 @@
+import asyncio
 import fnmatch
+import functools
+import inspect
+import itertools
 import logging
+import re
 import typing as t
 from dataclasses import dataclass, field
 
 from .event import Event
+from .signature import SignatureVerifier
 
 T = t.TypeVar("T")
 logger = logging.getLogger(__name__)
 
+#: The maximum number of event names for which #Webhook caches the matching handlers.
+_MAX_RESOLVED_EVENTS = 256
 
-@dataclass
+
+@dataclass(frozen=True)
 class EventHandler:
+    __slots__ = ("event", "func", "_is_literal", "_regex")
+
     event: str  #: An event name or #fnmatch pattern.
-    func: t.Callable[[Event], bool]
+    func: t.Callable[[Event], t.Union[bool, t.Awaitable[bool]]]  #: Async functions require #Webhook.dispatch_async().
+
+    if t.TYPE_CHECKING:
+        # Set in #__post_init__(), declared here for type checkers only.
+        _is_literal: bool = field(init=False, repr=False, compare=False)
+        _regex: t.Optional[t.Pattern[str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Precompile the pattern once so that #Webhook.dispatch() does not need to go through #fnmatch for
+        # every event. Event names without glob characters are compared for equality instead. The handler is
+        # frozen, so these can not get out of sync with the #event.
+        is_literal = not any(c in self.event for c in "*?[")
+        object.__setattr__(self, "_is_literal", is_literal)
+        object.__setattr__(self, "_regex", None if is_literal else re.compile(fnmatch.translate(self.event)))
+
+    def __reduce__(self) -> t.Tuple[t.Any, ...]:
+        # NOTE: Copying or unpickling restores __slots__ with setattr() by default, which a frozen dataclass refuses.
+        return (EventHandler, (self.event, self.func))
+
+    def matches(self, event_name: str) -> bool:
+        """
+        Returns #True if the *event_name* matches the #event name or pattern of this handler.
+        """
+
+        if self._is_literal:
+            return self.event == event_name
+        assert self._regex is not None
+        return self._regex.match(event_name) is not None
+
+
+class _HandlerIndex:
+    """
+    Looks up the handlers matching an event name. Handlers for concrete event names are looked up by name, only
+    glob patterns need to be tested against every event. Each handler is stored with its position in #handlers
+    to retain the dispatch order.
+    """
+
+    def __init__(self, handlers: t.List[EventHandler]) -> None:
+        #: A copy of the handlers that the index was built from.
+        self.handlers = list(handlers)
+        self.literal: t.Dict[str, t.List[t.Tuple[int, EventHandler]]] = {}
+        self.glob: t.List[t.Tuple[int, EventHandler]] = []
+        for index, handler in enumerate(self.handlers):
+            if handler._is_literal:
+                self.literal.setdefault(handler.event, []).append((index, handler))
+            else:
+                self.glob.append((index, handler))
+        # All glob patterns are combined into a single regular expression which tells us the first matching handler
+        # in one go (or that none matches, the common case).
+        self.glob_regex: t.Optional[t.Pattern[str]] = None
+        if self.glob:
+            self.glob_regex = re.compile(
+                "|".join(f"(?P<h{i}>{fnmatch.translate(h.event)})" for i, (_, h) in enumerate(self.glob))
+            )
+        # The handlers that match an event name, in dispatch order.
+        self.resolved: t.Dict[str, t.List[EventHandler]] = {}
+
+    def get(self, event_name: str) -> t.List[EventHandler]:
+        """
+        Returns the handlers matching the *event_name* in dispatch order. The result is cached per event name.
+        """
+
+        handlers = self.resolved.get(event_name)
+        if handlers is None:
+            candidates = self.literal.get(event_name, [])
+            globs = self._match_globs(event_name)
+            if globs:
+                candidates = sorted(candidates + globs, key=lambda item: item[0])
+            handlers = [handler for _, handler in candidates]
+            if len(self.resolved) >= _MAX_RESOLVED_EVENTS:
+                self.resolved.clear()
+            self.resolved[event_name] = handlers
+        return handlers
+
+    def _match_globs(self, event_name: str) -> t.List[t.Tuple[int, EventHandler]]:
+        """
+        Returns the glob handlers that match the *event_name*. Only the handlers that follow the first one matched
+        by the combined #glob_regex need to be tested individually.
+        """
+
+        if self.glob_regex is None:
+            return []
+        match = self.glob_regex.match(event_name)
+        if match is None:
+            return []
+        assert match.lastgroup is not None
+        first = int(match.lastgroup[1:])
+        rest = itertools.islice(self.glob, first + 1, None)
+        return [self.glob[first]] + [item for item in rest if item[1].matches(event_name)]
 
 
 @dataclass
@@ -28,6 +127,36 @@ class Webhook:
 
     handlers: t.List[EventHandler] = field(default_factory=list)
 
+    #: The #secret encoded as bytes, which is what is needed to verify the payload signature.
+    secret_bytes: t.Optional[bytes] = field(init=False, repr=False, compare=False)
+
+    #: Verifies payload signatures with the #secret, reusing the HMAC key setup across events.
+    signature_verifier: t.Optional[SignatureVerifier] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._index = _HandlerIndex([])
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        super().__setattr__(name, value)
+        # Keep #secret_bytes and #signature_verifier in sync if the #secret is changed after the webhook was created.
+        if name == "secret":
+            secret_bytes = None if value is None else value.encode("ascii")
+            super().__setattr__("secret_bytes", secret_bytes)
+            super().__setattr__("signature_verifier", None if secret_bytes is None else SignatureVerifier(secret_bytes))
+
+    def _get_handlers(self, event_name: str) -> t.List[EventHandler]:
+        """
+        Returns the handlers matching the *event_name* in dispatch order.
+        """
+
+        # NOTE: The index is rebuilt whenever the #handlers were modified. Comparing them to the handlers the index
+        #       was built from is cheap, as the lists usually contain the same objects which are compared by identity
+        #       first. The index is only ever replaced as a whole, so concurrent dispatches do not need a lock.
+        index = self._index
+        if index.handlers != self.handlers:
+            index = self._index = _HandlerIndex(self.handlers)
+        return index.get(event_name)
+
     @t.overload
     def listen(self, event: str) -> t.Callable[[T], T]:
         """
@@ -36,7 +165,7 @@ class Webhook:
         """
 
     @t.overload
-    def listen(self, event: str, func: t.Callable[[Event], bool]) -> None:
+    def listen(self, event: str, func: t.Callable[[Event], t.Union[bool, t.Awaitable[bool]]]) -> None:
         """
         Directly register an event handler function.
         """
@@ -53,6 +182,14 @@ class Webhook:
         else:
             self.handlers.append(EventHandler(event, func))
 
+    def has_handlers(self, event_name: str) -> bool:
+        """
+        Returns #True if any handler matches the *event_name*. HTTP bindings use this to skip verifying and
+        parsing events that would not be handled anyway.
+        """
+
+        return bool(self._get_handlers(event_name))
+
     def dispatch(self, event: Event) -> bool:
         """
         Dispatch an event on the first handler that matches it.
@@ -60,13 +197,50 @@ class Webhook:
         Returns #True only if the event was handled by a handler.
         """
 
-        matched = False
+        handlers = self._get_handlers(event.name)
+        for handler in handlers:
+            result = handler.func(event)
+            if inspect.isawaitable(result):
+                if inspect.iscoroutine(result):
+                    result.close()
+                raise TypeError(f"handler for {handler.event!r} is asynchronous, use Webhook.dispatch_async()")
+            if result:
+                return True
+
+        return self._unhandled(event, handlers)
+
+    async def dispatch_async(
+        self,
+        event: Event,
+        run_sync: t.Optional[t.Callable[..., t.Awaitable[t.Any]]] = None,
+    ) -> bool:
+        """
+        Like #dispatch(), but awaits handlers that are async functions. Other handlers are passed to *run_sync*
+        together with the *event*, which must call them in a worker thread so that they do not block the event
+        loop. It defaults to the default executor of the event loop. HTTP bindings pass their own thread pool so
+        that all blocking work is limited by it, e.g. the ASGI binding passes Starlette's #run_in_threadpool().
 
-        for handler in self.handlers:
-            if fnmatch.fnmatch(event.name, handler.event):
-                matched = True
-                if handler.func(event):
-                    return True
-        logger.info(f'Event %r (id: %r) goes {"unhandled" if matched else "unmatched"}.', event.name, event.delivery_id)
+        Returns #True only if the event was handled by a handler.
+        """
 
+        if run_sync is None:
+            run_sync = functools.partial(asyncio.get_running_loop().run_in_executor, None)
+        handlers = self._get_handlers(event.name)
+        for handler in handlers:
+            if inspect.iscoroutinefunction(handler.func):
+                result = await handler.func(event)
+            else:
+                result = await run_sync(handler.func, event)
+                if inspect.isawaitable(result):
+                    result = await result
+            if result:
+                return True
+
+        return self._unhandled(event, handlers)
+
+    def _unhandled(self, event: Event, handlers: t.List[EventHandler]) -> bool:
+        matched = bool(handlers)
+        logger.info(
+            "Event %r (id: %r) goes %s.", event.name, event.delivery_id, "unhandled" if matched else "unmatched"
+        )
         return matched
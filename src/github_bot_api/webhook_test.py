@@ -0,0 +1,207 @@
+import asyncio
+import copy
+import dataclasses
+import pickle
+import threading
+import typing as t
+
+import pytest
+
+from github_bot_api.event import Event
+from github_bot_api.signature import compute_signature
+from github_bot_api.webhook import EventHandler, Webhook
+
+
+def make_event(name: str) -> Event:
+    return Event(name, "delivery-id", None, "GitHub-Hookshot/test", {})
+
+
+def record(calls: t.List[t.Any], value: t.Any, result: bool) -> t.Callable[[Event], bool]:
+    def handler(event: Event) -> bool:
+        calls.append(value)
+        return result
+
+    return handler
+
+
+def test_event_handler_matches():
+    assert EventHandler("push", lambda e: True).matches("push")
+    assert not EventHandler("push", lambda e: True).matches("pushed")
+    assert EventHandler("pull_request*", lambda e: True).matches("pull_request_review")
+    assert not EventHandler("pull_request*", lambda e: True).matches("push")
+    assert EventHandler("*", lambda e: True).matches("anything")
+    assert EventHandler("[cp]ush", lambda e: True).matches("push")
+
+
+def test_event_handler_is_frozen():
+    handler = EventHandler("push", lambda e: True)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        handler.event = "issues"  # type: ignore[misc]
+
+
+def test_dispatch_calls_handlers_in_order_until_handled():
+    calls: t.List[t.Any] = []
+    webhook = Webhook(secret=None)
+    webhook.listen("*", record(calls, "glob", False))
+    webhook.listen("push", record(calls, "push", True))
+    webhook.listen("pu*", record(calls, "never", True))
+
+    assert webhook.dispatch(make_event("push"))
+    assert calls == ["glob", "push"]
+
+
+def test_dispatch_unmatched():
+    webhook = Webhook(secret=None)
+    webhook.listen("push", lambda e: True)
+    assert not webhook.dispatch(make_event("issues"))
+
+
+def test_dispatch_with_handlers_passed_to_constructor():
+    webhook = Webhook(secret=None, handlers=[EventHandler("issue*", lambda e: True)])
+    assert webhook.dispatch(make_event("issues"))
+    assert not webhook.dispatch(make_event("push"))
+
+
+def test_dispatch_tries_all_matching_glob_handlers():
+    calls: t.List[t.Any] = []
+    webhook = Webhook(secret=None)
+    webhook.listen("issue*", record(calls, 1, False))
+    webhook.listen("pull_request*", record(calls, 2, False))
+    webhook.listen("*_review", record(calls, 3, False))
+    webhook.listen("pull_*_review", record(calls, 4, True))
+
+    assert webhook.dispatch(make_event("pull_request_review"))
+    assert calls == [2, 3, 4]
+
+    calls.clear()
+    webhook.listen("issues", record(calls, 5, True))
+    assert webhook.dispatch(make_event("issues"))
+    assert calls == [1, 5]
+
+
+def test_dispatch_after_modifying_handlers():
+    webhook = Webhook(secret=None)
+    webhook.listen("push", lambda e: False)
+    assert not webhook.dispatch(make_event("issues"))
+
+    webhook.handlers.append(EventHandler("issues", lambda e: True))
+    assert webhook.dispatch(make_event("issues"))
+
+    webhook.handlers = [EventHandler("is*", lambda e: True)]
+    assert not webhook.dispatch(make_event("push"))
+    assert webhook.dispatch(make_event("issues"))
+
+    webhook.handlers.clear()
+    assert not webhook.dispatch(make_event("issues"))
+
+
+def test_dispatch_after_modifying_list_passed_to_constructor():
+    handlers: t.List[EventHandler] = []
+    webhook = Webhook(secret=None, handlers=handlers)
+    assert not webhook.dispatch(make_event("push"))
+
+    handlers.append(EventHandler("push", lambda e: True))
+    assert webhook.dispatch(make_event("push"))
+
+
+def test_dispatch_after_inserting_handler():
+    calls: t.List[t.Any] = []
+    webhook = Webhook(secret=None)
+    webhook.listen("push", record(calls, "a", True))
+    assert webhook.dispatch(make_event("push"))
+
+    webhook.handlers.insert(0, EventHandler("push", record(calls, "b", True)))
+    assert webhook.dispatch(make_event("push"))
+    assert calls == ["a", "b"]
+
+
+def test_dispatch_after_removing_and_appending_handler():
+    calls: t.List[t.Any] = []
+    webhook = Webhook(secret=None)
+    webhook.listen("push", record(calls, "a", True))
+    assert webhook.dispatch(make_event("push"))
+
+    webhook.handlers.remove(webhook.handlers[0])
+    webhook.handlers.append(EventHandler("issues", record(calls, "b", True)))
+    assert not webhook.dispatch(make_event("push"))
+    assert webhook.dispatch(make_event("issues"))
+    assert calls == ["a", "b"]
+
+
+def test_dispatch_after_assigning_handler():
+    calls: t.List[t.Any] = []
+    webhook = Webhook(secret=None)
+    webhook.listen("push", record(calls, "a", True))
+    assert webhook.dispatch(make_event("push"))
+
+    webhook.handlers[0] = EventHandler("pu*", record(calls, "b", True))
+    assert webhook.dispatch(make_event("push"))
+    assert calls == ["a", "b"]
+
+
+def handle_push(event: Event) -> bool:
+    return event.name == "push"
+
+
+def test_copy_and_pickle():
+    webhook = Webhook(secret="secret")
+    webhook.listen("push", handle_push)
+    assert webhook.dispatch(make_event("push"))
+
+    for clone in (copy.deepcopy(webhook), pickle.loads(pickle.dumps(webhook))):
+        assert clone == webhook
+        assert clone.signature_verifier is not None
+        assert clone.signature_verifier.compute_signature(b"{}") == compute_signature(b"{}", b"secret")
+        assert clone.dispatch(make_event("push"))
+        clone.handlers.clear()
+        assert not clone.dispatch(make_event("push"))
+        assert webhook.dispatch(make_event("push"))
+
+
+def test_secret_bytes():
+    assert Webhook(secret=None).secret_bytes is None
+    assert Webhook(secret="secret").secret_bytes == b"secret"
+
+    webhook = Webhook(secret=None)
+    webhook.secret = "changed"
+    assert webhook.secret_bytes == b"changed"
+    assert webhook.signature_verifier is not None
+    assert webhook.signature_verifier.compute_signature(b"{}") == compute_signature(b"{}", b"changed")
+
+
+def test_dispatch_rejects_async_handlers():
+    async def handler(event: Event) -> bool:
+        return True
+
+    webhook = Webhook(secret=None)
+    webhook.listen("push", handler)
+    with pytest.raises(TypeError):
+        webhook.dispatch(make_event("push"))
+    assert asyncio.run(webhook.dispatch_async(make_event("push")))
+
+
+def test_dispatch_async_runs_sync_handlers_in_worker_thread():
+    threads: t.Dict[str, int] = {}
+    webhook = Webhook(secret=None)
+
+    @webhook.listen("push")
+    async def on_push_async(event: Event) -> bool:
+        threads["loop"] = threading.get_ident()
+        return False
+
+    @webhook.listen("push")
+    def on_push(event: Event) -> bool:
+        threads["handler"] = threading.get_ident()
+        return True
+
+    assert asyncio.run(webhook.dispatch_async(make_event("push")))
+    assert threads["handler"] != threads["loop"]
+
+    calls: t.List[t.Any] = []
+
+    async def run_sync(func: t.Callable[[Event], bool], event: Event) -> bool:
+        calls.append(func)
+        return func(event)
+
+    assert asyncio.run(webhook.dispatch_async(make_event("push"), run_sync))
+    assert calls == [on_push]